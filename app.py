@@ -1,10 +1,18 @@
+import hmac
+import html
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import pandas as pd
-import pytz
+from operator import itemgetter
+import ijson
+import orjson
 import requests
 import streamlit as st
+import streamlit.components.v1 as components
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import plotly.graph_objects as go
 
 
@@ -12,6 +20,7 @@ import plotly.graph_objects as go
 load_dotenv()
 API_URL = st.secrets.get("API_URL", "http://localhost:8000/api")
 API_KEY = st.secrets.get("API_KEY", "")
+THEME_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "cyberpunk.css")
 
 
 st.set_page_config(
@@ -22,309 +31,177 @@ st.set_page_config(
 )
 
 
+RATING_OPTIONS = [1, 2, 3, 4, 5]
+SENTIMENT_OPTIONS = ["Positive", "Neutral", "Negative", "Unknown"]
+SENTIMENT_COLORS = {
+    "Positive": "#00ff00",
+    "Neutral": "#ffff00",
+    "Negative": "#ff0000",
+    "Unknown": "#888888"
+}
+STARS = tuple("★" * r + "☆" * (5 - r) for r in range(6))
+
+# Fallback values for fields the API may omit on unprocessed feedback
+FEEDBACK_DEFAULTS = {
+    "review": "",
+    "ai_summary": "PROCESSING...",
+    "ai_actions": "PROCESSING...",
+    "ai_response": "",
+    "sentiment": "Unknown",
+    "created_at": "",
+}
+
+
 # ==================== HELPER FUNCTIONS ====================
+@st.cache_resource(show_spinner=False)
+def get_session(api_key):
+    """Pooled HTTP session shared across reruns so API connections stay alive"""
+    session = requests.Session()
+    session.headers.update({"X-API-Key": api_key})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_analytics():
+    """Load analytics data from API; raises so failures are not cached"""
+    response = get_session(API_KEY).get(f"{API_URL}/admin/analytics", timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@st.cache_resource(ttl=30, show_spinner=False)
+def load_feedbacks(limit):
+    """Load feedback from API into a frame, newest first; raises so failures are not cached
+
+    The frame is shared across reruns and sessions, so callers must not mutate it.
+    """
+    with get_session(API_KEY).get(
+        f"{API_URL}/admin/feedbacks",
+        params={"limit": limit},
+        stream=True,
+        timeout=30
+    ) as response:
+        response.raise_for_status()
+        # Normalize records as they are parsed off the wire
+        response.raw.decode_content = True
+        feedbacks = [
+            prepare_feedback(fb)
+            for fb in ijson.items(response.raw, "item", use_float=True)
+        ]
+    feedbacks.sort(key=itemgetter("created_at"), reverse=True)
+    return to_frame(feedbacks)
+
+
 def fetch_analytics():
     """Fetch analytics data from API"""
     try:
-        response = requests.get(
-            f"{API_URL}/admin/analytics",
-            headers={"X-API-Key": API_KEY},
-            timeout=10
-        )
-        return response.json() if response.status_code == 200 else None
+        return load_analytics()
     except Exception as e:
         st.error(f"Analytics fetch error: {str(e)}")
         return None
 
 
 def fetch_feedbacks(limit=100):
-    """Fetch feedback data from API"""
+    """Fetch feedback frame from API, newest first"""
     try:
-        response = requests.get(
-            f"{API_URL}/admin/feedbacks",
-            headers={"X-API-Key": API_KEY},
-            params={"limit": limit},
-            timeout=30
-        )
-        return response.json() if response.status_code == 200 else []
+        return load_feedbacks(limit)
     except Exception as e:
         st.error(f"Feedback fetch error: {str(e)}")
-        return []
+        return None
+
+
+def prepare_feedback(feedback):
+    """Attach precomputed display fields to a feedback record"""
+    feedback["created_at"] = feedback.get("created_at") or ""
+    feedback["_sentiment"] = normalize_sentiment(feedback)
+    return feedback
+
+
+def fetch_dashboard_data(max_records):
+    """Fetch analytics and feedbacks concurrently"""
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=2,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        analytics_future = executor.submit(fetch_analytics)
+        feedbacks_future = executor.submit(fetch_feedbacks, max_records)
+        return analytics_future.result(), feedbacks_future.result()
 
 
 def normalize_sentiment(feedback):
     """Extract and normalize sentiment value"""
-    return feedback.get("sentiment", "Unknown").rstrip(".")
-
-
-def filter_feedbacks(feedbacks, rating_filter, sentiment_filter, search_query):
-    """Apply filters to feedback list"""
-    return [
-        fb for fb in feedbacks
-        if fb["rating"] in rating_filter
-        and normalize_sentiment(fb) in sentiment_filter
-        and (not search_query or 
-             search_query.lower() in fb.get("review", "").lower() or
-             search_query.lower() in fb.get("ai_summary", "").lower())
+    return (feedback.get("sentiment") or "Unknown").rstrip(".")
+
+
+def to_frame(feedbacks):
+    """Build a columnar frame with compact filter columns and a lowercased search column"""
+    import numpy as np
+    import pandas as pd
+    
+    df = pd.DataFrame(feedbacks)
+    for column in (*FEEDBACK_DEFAULTS, "rating", "_sentiment"):
+        if column not in df:
+            df[column] = None
+    # Null or out-of-range ratings can never match the rating filter
+    ratings = pd.to_numeric(df["rating"], errors="coerce")
+    valid = ratings.isin(RATING_OPTIONS)
+    df = df[valid].copy()
+    df["rating"] = ratings[valid].astype(np.int8)
+    df["_sentiment"] = df["_sentiment"].astype("category")
+    df["created_date"] = df["created_at"].fillna("").str[:10]
+    df["search_blob"] = (
+        df["review"].fillna("") + "\n" + df["ai_summary"].fillna("")
+    ).str.lower()
+    return df.fillna(FEEDBACK_DEFAULTS)
+
+
+def contains_query(blobs, query):
+    """Substring test of a lowercased query over an array of lowercased search blobs"""
+    import numpy as np
+    
+    return np.fromiter((query in blob for blob in blobs), dtype=bool, count=len(blobs))
+
+
+def filter_feedbacks(df, rating_filter, sentiment_filter, search_query):
+    """Apply filters to feedback frame"""
+    import numpy as np
+    
+    query = search_query.strip().lower() if search_query else ""
+    sentiments = df["_sentiment"].cat
+    if (
+        not query
+        and set(rating_filter) >= set(RATING_OPTIONS)
+        and set(sentiment_filter) >= set(sentiments.categories)
+    ):
+        return df
+    
+    sentiment_codes = [
+        code for code, sentiment in enumerate(sentiments.categories)
+        if sentiment in sentiment_filter
     ]
+    mask = (
+        np.isin(df["rating"].to_numpy(), rating_filter)
+        & np.isin(sentiments.codes.to_numpy(), sentiment_codes)
+    )
+    if query:
+        mask &= contains_query(df["search_blob"].to_numpy(), query)
+    return df[mask]
 
 
 # ==================== CYBERPUNK THEME ====================
+@st.cache_resource(show_spinner=False)
+def load_cyberpunk_css():
+    """Read the theme stylesheet once per process"""
+    with open(THEME_CSS_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
 def apply_cyberpunk_theme():
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;600;700&display=swap');
-    
-    * { font-family: 'JetBrains Mono', monospace; }
-    
-    .main {
-        background: linear-gradient(135deg, #0a0a0a 0%, #0f0f23 100%);
-        color: #e5e5e5;
-    }
-    
-    .block-container {
-        padding: 2rem 2rem 4rem 2rem;
-        max-width: 1600px;
-    }
-    
-    #MainMenu, footer, header { visibility: hidden; }
-    
-    /* ===== HEADER ===== */
-    .dash-header {
-        margin-bottom: 3rem;
-        padding-bottom: 1.5rem;
-        border-bottom: 1px solid rgba(0, 255, 255, 0.3);
-    }
-    
-    .dash-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #ffffff;
-        letter-spacing: 0.1em;
-        text-shadow: 0 0 20px rgba(0, 255, 255, 0.5);
-    }
-    
-    .dash-subtitle {
-        font-size: 0.875rem;
-        color: #00ffff;
-        letter-spacing: 0.3em;
-        text-transform: uppercase;
-    }
-    
-    /* ===== METRICS ===== */
-    div[data-testid="stMetric"] {
-        background: rgba(15, 15, 35, 0.7);
-        border: 1px solid rgba(0, 255, 255, 0.25);
-        border-radius: 12px;
-        padding: 1.5rem;
-        transition: all 0.3s ease;
-        backdrop-filter: blur(10px);
-    }
-    
-    div[data-testid="stMetric"]:hover {
-        border-color: rgba(0, 255, 255, 0.6);
-        transform: translateY(-4px);
-        box-shadow: 0 8px 32px rgba(0, 255, 255, 0.2);
-    }
-    
-    div[data-testid="stMetric"] label {
-        color: #888 !important;
-        font-size: 0.7rem !important;
-        font-weight: 600 !important;
-        text-transform: uppercase;
-        letter-spacing: 0.15em;
-    }
-    
-    div[data-testid="stMetric"] [data-testid="stMetricValue"] {
-        color: #ffffff !important;
-        font-size: 2.5rem !important;
-        font-weight: 700 !important;
-    }
-    
-    /* ===== DIVIDERS ===== */
-    .neon-divider {
-        height: 2px;
-        background: linear-gradient(90deg, transparent, #00ffff, #ff00ff, transparent);
-        margin: 2.5rem 0;
-        opacity: 0.5;
-    }
-    
-    .section-title {
-        font-size: 0.9rem;
-        font-weight: 600;
-        color: #00ffff;
-        text-transform: uppercase;
-        letter-spacing: 0.2em;
-        margin-bottom: 1.5rem;
-        padding-left: 1rem;
-        border-left: 3px solid #ff00ff;
-    }
-    
-    /* ===== EXPANDERS ===== */
-    .streamlit-expanderHeader {
-        background: rgba(15, 15, 35, 0.8) !important;
-        border: 1px solid rgba(0, 255, 255, 0.25) !important;
-        border-radius: 10px !important;
-        padding: 1.25rem 1.5rem !important;
-        font-size: 0.875rem !important;
-        font-weight: 500 !important;
-        color: #e5e5e5 !important;
-        transition: all 0.3s ease !important;
-        backdrop-filter: blur(10px);
-    }
-    
-    .streamlit-expanderHeader:hover {
-        border-color: rgba(0, 255, 255, 0.5) !important;
-        transform: translateX(8px);
-    }
-    
-    .streamlit-expanderContent {
-        background: rgba(10, 10, 25, 0.9) !important;
-        border: 1px solid rgba(0, 255, 255, 0.2) !important;
-        border-top: none !important;
-        border-radius: 0 0 10px 10px !important;
-        padding: 1.75rem !important;
-        backdrop-filter: blur(10px);
-    }
-    
-    /* ===== MULTISELECT ===== */
-    .stMultiSelect > div > div {
-        background: rgba(15, 15, 35, 0.8) !important;
-        border: 1px solid rgba(0, 255, 255, 0.25) !important;
-        border-radius: 10px !important;
-        backdrop-filter: blur(10px);
-    }
-    
-    .stMultiSelect [data-baseweb="tag"] {
-        background: rgba(0, 255, 255, 0.15) !important;
-        color: #00ffff !important;
-        border: 1px solid rgba(0, 255, 255, 0.3) !important;
-        border-radius: 6px !important;
-    }
-    
-    /* ===== INPUT ===== */
-    input {
-        background: rgba(15, 15, 35, 0.8) !important;
-        border: 1px solid rgba(0, 255, 255, 0.25) !important;
-        border-radius: 10px !important;
-        color: #ffffff !important;
-        padding: 0.875rem 1.25rem !important;
-        backdrop-filter: blur(10px);
-    }
-    
-    input:focus {
-        border-color: #00ffff !important;
-        box-shadow: 0 0 0 2px rgba(0, 255, 255, 0.15) !important;
-    }
-    
-    /* ===== INFO BOXES ===== */
-    .stInfo, .stWarning, .stError {
-        background: rgba(15, 15, 35, 0.8) !important;
-        border: 1px solid rgba(0, 255, 255, 0.25) !important;
-        border-left: 3px solid #00ffff !important;
-        border-radius: 10px !important;
-        backdrop-filter: blur(10px);
-    }
-    
-    /* ===== CONTENT BOX ===== */
-    .content-box {
-        background: rgba(15, 15, 35, 0.9);
-        border: 1px solid rgba(0, 255, 255, 0.2);
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.75rem 0;
-        line-height: 1.7;
-    }
-    
-    .terminal-box {
-        background: rgba(0, 0, 0, 0.6);
-        border-left: 3px solid #00ff00;
-        border-radius: 6px;
-        padding: 1rem;
-        color: #00ff00;
-        font-size: 0.85rem;
-        line-height: 1.6;
-    }
-    
-    /* ===== STATS BAR ===== */
-    .stats-bar {
-        display: flex;
-        justify-content: space-between;
-        padding: 1.25rem 1.75rem;
-        background: rgba(15, 15, 35, 0.7);
-        border: 1px solid rgba(0, 255, 255, 0.25);
-        border-radius: 12px;
-        margin-bottom: 2rem;
-        backdrop-filter: blur(10px);
-    }
-    
-    .stats-label {
-        font-size: 0.8rem;
-        color: #888;
-    }
-    
-    .stats-value {
-        font-weight: 700;
-        color: #00ffff;
-        margin-left: 0.5rem;
-    }
-    
-    /* ===== FAB ===== */
-    .cyber-fab {
-        position: fixed;
-        bottom: 2rem;
-        right: 2rem;
-        z-index: 9999;
-        width: 64px;
-        height: 64px;
-        border-radius: 50%;
-        background: linear-gradient(135deg, #00ffff, #ff00ff);
-        border: none;
-        color: #000;
-        font-size: 1.75rem;
-        font-weight: 700;
-        cursor: pointer;
-        box-shadow: 0 0 30px rgba(0, 255, 255, 0.4);
-        transition: all 0.3s ease;
-    }
-    
-    .cyber-fab:hover {
-        transform: rotate(360deg) scale(1.15);
-        box-shadow: 0 0 50px rgba(0, 255, 255, 0.6);
-    }
-    
-    /* ===== AUTH SCREEN ===== */
-    .auth-card {
-        background: rgba(15, 15, 35, 0.95);
-        border: 1px solid rgba(0, 255, 255, 0.4);
-        border-radius: 20px;
-        padding: 3rem 2.5rem;
-        max-width: 480px;
-        margin: 10rem auto;
-        backdrop-filter: blur(20px);
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
-    }
-    
-    .auth-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #ffffff;
-        text-align: center;
-        letter-spacing: 0.1em;
-        text-shadow: 0 0 20px rgba(0, 255, 255, 0.5);
-        margin-bottom: 0.5rem;
-    }
-    
-    .auth-subtitle {
-        font-size: 0.8rem;
-        color: #00ffff;
-        text-align: center;
-        text-transform: uppercase;
-        letter-spacing: 0.3em;
-        margin-bottom: 2rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_cyberpunk_css()}</style>", unsafe_allow_html=True)
 
 
 # ==================== UI COMPONENTS ====================
@@ -340,18 +217,22 @@ def render_header():
         """, unsafe_allow_html=True)
     
     with col2:
-        # Get IST time
-        ist = pytz.timezone('Asia/Kolkata')
-        current_time = datetime.now(ist).strftime("%H:%M:%S")
-        
-        st.markdown(f"""
-        <div style="text-align: right; padding-top: 1rem;">
+        # IST clock ticks in the browser so it never triggers a rerun
+        components.html("""
+        <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;700&display=swap" rel="stylesheet">
+        <div style="text-align: right; padding-top: 1rem; font-family: 'JetBrains Mono', monospace;">
             <div style="font-size: 0.7rem; color: #888; letter-spacing: 0.1em;">LOCAL TIME (IST)</div>
-            <div style="font-size: 1.5rem; font-weight: 700; color: #00ffff; margin-top: 0.2rem;">
-                {current_time}
-            </div>
+            <div id="clock" style="font-size: 1.5rem; font-weight: 700; color: #00ffff; margin-top: 0.2rem;"></div>
         </div>
-        """, unsafe_allow_html=True)
+        <script>
+            const clock = document.getElementById("clock");
+            const tick = () => {
+                clock.textContent = new Date().toLocaleTimeString("en-GB", {timeZone: "Asia/Kolkata", hour12: false});
+            };
+            tick();
+            setInterval(tick, 1000);
+        </script>
+        """, height=90)
 
 
 def render_metrics(analytics):
@@ -384,6 +265,62 @@ def render_metrics(analytics):
             st.metric("LAST SYNC", "—", delta="OFFLINE")
 
 
+@st.cache_resource(show_spinner=False)
+def build_radar_figure(rating_items):
+    """Build rating distribution radar chart; shared across reruns, so callers must not mutate it"""
+    ratings = [int(rating) for rating, _ in rating_items]
+    counts = [count for _, count in rating_items]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=counts + [counts[0]],
+        theta=[f'{r} STARS' for r in ratings] + [f'{ratings[0]} STARS'],
+        fill='toself',
+        fillcolor='rgba(0, 255, 255, 0.2)',
+        line=dict(color='#00ffff', width=2)
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(visible=True, showline=False, showticklabels=False),
+            bgcolor='rgba(15, 15, 35, 0.6)'
+        ),
+        showlegend=False,
+        margin=dict(l=20, r=20, t=20, b=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=300
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def build_gauge_figure(positive_rate):
+    """Build positive sentiment gauge chart; shared across reruns, so callers must not mutate it"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=positive_rate,
+        gauge={
+            'axis': {'range': [0, 100], 'tickcolor': "#00ffff"},
+            'bar': {'color': "#00ffff"},
+            'bgcolor': "rgba(15, 15, 35, 0.6)",
+            'bordercolor': "#00ffff",
+            'steps': [
+                {'range': [0, 33], 'color': 'rgba(255, 0, 0, 0.3)'},
+                {'range': [33, 66], 'color': 'rgba(255, 255, 0, 0.3)'},
+                {'range': [66, 100], 'color': 'rgba(0, 255, 0, 0.3)'}
+            ]
+        }
+    ))
+    
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=20, b=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        font={'color': "#ffffff", 'family': "JetBrains Mono"}
+    )
+    return fig
+
+
 def render_charts(analytics):
     """Render interactive charts"""
     col1, col2 = st.columns(2)
@@ -393,29 +330,7 @@ def render_charts(analytics):
         rating_dist = analytics.get("rating_distribution", {})
         
         if rating_dist:
-            ratings = list(map(int, rating_dist.keys()))
-            counts = list(rating_dist.values())
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatterpolar(
-                r=counts + [counts[0]],
-                theta=[f'{r} STARS' for r in ratings] + [f'{ratings[0]} STARS'],
-                fill='toself',
-                fillcolor='rgba(0, 255, 255, 0.2)',
-                line=dict(color='#00ffff', width=2)
-            ))
-            
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(visible=True, showline=False, showticklabels=False),
-                    bgcolor='rgba(15, 15, 35, 0.6)'
-                ),
-                showlegend=False,
-                margin=dict(l=20, r=20, t=20, b=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                height=300
-            )
-            
+            fig = build_radar_figure(tuple(sorted(rating_dist.items())))
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
     
     with col2:
@@ -426,29 +341,7 @@ def render_charts(analytics):
             total_fb = analytics.get("total_feedback", 1)
             positive_rate = (sentiment_data.get("Positive", 0) / total_fb) * 100
             
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=positive_rate,
-                gauge={
-                    'axis': {'range': [0, 100], 'tickcolor': "#00ffff"},
-                    'bar': {'color': "#00ffff"},
-                    'bgcolor': "rgba(15, 15, 35, 0.6)",
-                    'bordercolor': "#00ffff",
-                    'steps': [
-                        {'range': [0, 33], 'color': 'rgba(255, 0, 0, 0.3)'},
-                        {'range': [33, 66], 'color': 'rgba(255, 255, 0, 0.3)'},
-                        {'range': [66, 100], 'color': 'rgba(0, 255, 0, 0.3)'}
-                    ]
-                }
-            ))
-            
-            fig.update_layout(
-                height=300,
-                margin=dict(l=20, r=20, t=20, b=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                font={'color': "#ffffff", 'family': "JetBrains Mono"}
-            )
-            
+            fig = build_gauge_figure(positive_rate)
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
 
@@ -459,8 +352,8 @@ def render_filters():
     with col1:
         rating_filter = st.multiselect(
             "RATING FILTER",
-            options=[1, 2, 3, 4, 5],
-            default=[1, 2, 3, 4, 5],
+            options=RATING_OPTIONS,
+            default=RATING_OPTIONS,
             format_func=lambda x: f"{x} STARS",
             key="rating_filter"
         )
@@ -468,8 +361,8 @@ def render_filters():
     with col2:
         sentiment_filter = st.multiselect(
             "SENTIMENT FILTER",
-            options=["Positive", "Neutral", "Negative", "Unknown"],
-            default=["Positive", "Neutral", "Negative", "Unknown"],
+            options=SENTIMENT_OPTIONS,
+            default=SENTIMENT_OPTIONS,
             key="sentiment_filter"
         )
     
@@ -492,53 +385,98 @@ def render_filters():
     return rating_filter, sentiment_filter, search_query
 
 
+def feedback_label(feedback):
+    """Build the one-line summary label for a feedback record"""
+    return f"[ {feedback['rating']} STARS ] {feedback['_sentiment'].upper()} • {feedback['created_date']}"
+
+
+def card_text(value):
+    """Escape free text for the feedback card, keeping line breaks as <br>"""
+    return "<br>".join(html.escape(str(value)).splitlines())
+
+
 def render_feedback_item(feedback, idx):
     """Render individual feedback item"""
-    sentiment = normalize_sentiment(feedback)
-    sentiment_colors = {
-        "Positive": "#00ff00",
-        "Neutral": "#ffff00",
-        "Negative": "#ff0000",
-        "Unknown": "#888888"
-    }
-    
-    rating_display = f"{feedback['rating']} STARS"
-    
-    with st.expander(
-        f"[ {rating_display} ] {sentiment.upper()} • {feedback['created_at'][:10]}",
-        expanded=False
-    ):
-        col_a, col_b = st.columns([3, 2])
-        
-        with col_a:
-            st.markdown("### ORIGINAL REVIEW")
-            st.markdown(f'<div class="terminal-box">{feedback["review"]}</div>', unsafe_allow_html=True)
-            
-            st.markdown("### AI ANALYSIS")
-            summary = feedback.get("ai_summary", "PROCESSING...")
-            st.markdown(f'<div class="content-box">{summary}</div>', unsafe_allow_html=True)
-        
-        with col_b:
-            st.markdown("### METADATA")
-            
-            rating_display_full = "★" * feedback["rating"] + "☆" * (5 - feedback["rating"])
-            st.markdown(f'<div style="font-size: 1.2rem; color: #ffff00;">{rating_display_full}</div>', unsafe_allow_html=True)
-            
-            sentiment_color = sentiment_colors.get(sentiment, "#888888")
-            st.markdown(f"""
-            <div style="background: rgba(0, 255, 0, 0.1); border-left: 3px solid {sentiment_color};
-                     padding: 0.75rem; border-radius: 6px; margin: 1rem 0;">
-                <div style="font-weight: 600; color: {sentiment_color};">{sentiment.upper()}</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("### RECOMMENDED ACTIONS")
-            actions = feedback.get("ai_actions", "PROCESSING...")
-            st.markdown(f'<div class="content-box" style="color: #ffaa00;">{actions}</div>', unsafe_allow_html=True)
-        
-        st.markdown("### AI RESPONSE")
-        ai_response = feedback.get("ai_response", "")
-        st.markdown(f'<div class="content-box" style="color: #aaaaaa;">{ai_response}</div>', unsafe_allow_html=True)
+    sentiment = feedback["_sentiment"]
+    rating_display_full = STARS[feedback["rating"]]
+    sentiment_color = SENTIMENT_COLORS.get(sentiment, "#888888")
+    summary = feedback.get("ai_summary", "PROCESSING...")
+    actions = feedback.get("ai_actions", "PROCESSING...")
+    ai_response = feedback.get("ai_response", "")
+    
+    # One unindented line with no raw newlines, so free text cannot end the HTML block early
+    card = "".join([
+        '<div class="feedback-card">',
+        '<div class="feedback-grid">',
+        '<div>',
+        '<div class="feedback-heading">ORIGINAL REVIEW</div>',
+        f'<div class="terminal-box">{card_text(feedback["review"])}</div>',
+        '<div class="feedback-heading">AI ANALYSIS</div>',
+        f'<div class="content-box">{card_text(summary)}</div>',
+        '</div>',
+        '<div>',
+        '<div class="feedback-heading">METADATA</div>',
+        f'<div style="font-size: 1.2rem; color: #ffff00;">{rating_display_full}</div>',
+        f'<div style="background: rgba(0, 255, 0, 0.1); border-left: 3px solid {sentiment_color}; '
+        'padding: 0.75rem; border-radius: 6px; margin: 1rem 0;">',
+        f'<div style="font-weight: 600; color: {sentiment_color};">{card_text(sentiment.upper())}</div>',
+        '</div>',
+        '<div class="feedback-heading">RECOMMENDED ACTIONS</div>',
+        f'<div class="content-box" style="color: #ffaa00;">{card_text(actions)}</div>',
+        '</div>',
+        '</div>',
+        '<div class="feedback-heading">AI RESPONSE</div>',
+        f'<div class="content-box" style="color: #aaaaaa;">{card_text(ai_response)}</div>',
+        '</div>',
+    ])
+    
+    with st.expander(feedback_label(feedback), expanded=True):
+        st.markdown(card, unsafe_allow_html=True)
+
+
+def render_feedback_table(df):
+    """Render feedback summary table and the selected record"""
+    if df.empty:
+        st.markdown('<div class="terminal-box">NO RECORDS MATCH CURRENT FILTERS</div>', unsafe_allow_html=True)
+        return
+    
+    st.dataframe(
+        df[["rating", "_sentiment", "created_at"]].rename(
+            columns={"rating": "RATING", "_sentiment": "SENTIMENT", "created_at": "CREATED"}
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    selected = st.selectbox(
+        "INSPECT RECORD",
+        options=df.index,
+        format_func=lambda i: feedback_label(df.loc[i]),
+        key="inspect_record"
+    )
+    render_feedback_item(df.loc[selected].to_dict(), selected)
+
+
+@st.fragment
+def render_feedback_stream(df):
+    """Render filters and feedback stream; filter changes rerun only this fragment"""
+    # Filters
+    rating_filter, sentiment_filter, search_query = render_filters()
+    
+    # Apply filters
+    filtered_feedbacks = filter_feedbacks(df, rating_filter, sentiment_filter, search_query)
+    
+    # Stats bar
+    st.markdown(f"""
+    <div class="stats-bar">
+        <div class="stats-label">DISPLAYING <span class="stats-value">{len(filtered_feedbacks)}</span> OF <span class="stats-value">{len(df)}</span> RECORDS</div>
+        <div class="stats-label">STATUS: <span class="stats-value">ACTIVE</span></div>
+        <div class="stats-label">UPDATED: <span class="stats-value">{datetime.now().strftime('%H:%M:%S')}</span></div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Render feedback table with single-record drill-down
+    render_feedback_table(filtered_feedbacks.head(50))
 
 
 def render_sidebar():
@@ -589,6 +527,11 @@ def render_sidebar():
         
         st.markdown("---")
         
+        if st.button("FORCE SYNC", use_container_width=True, key="force_sync_button"):
+            load_analytics.clear()
+            load_feedbacks.clear()
+            st.rerun()
+        
         if st.button("LOGOUT", use_container_width=True, type="primary", key="logout_button"):
             st.session_state.authenticated = False
             st.rerun()
@@ -624,7 +567,7 @@ def render_auth_screen():
         st.markdown("<br>", unsafe_allow_html=True)
         
         if st.button("AUTHENTICATE", type="primary", use_container_width=True):
-            if api_key_input == API_KEY:
+            if hmac.compare_digest(api_key_input.encode(), (API_KEY or "").encode()):
                 st.session_state.authenticated = True
                 st.rerun()
             else:
@@ -655,8 +598,11 @@ def main():
     # Render main dashboard
     render_header()
     
+    # Fetch data
+    max_records = st.session_state.get("max_records_slider", 100)
+    analytics, feedbacks = fetch_dashboard_data(max_records)
+    
     # Analytics section
-    analytics = fetch_analytics()
     if analytics:
         render_metrics(analytics)
         st.markdown('<div class="neon-divider"></div>', unsafe_allow_html=True)
@@ -668,28 +614,8 @@ def main():
     st.markdown('<div class="neon-divider"></div>', unsafe_allow_html=True)
     st.markdown('<div class="section-title">FEEDBACK STREAM</div>', unsafe_allow_html=True)
     
-    feedbacks = fetch_feedbacks()
-    if feedbacks:
-        feedbacks = sorted(feedbacks, key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        # Filters
-        rating_filter, sentiment_filter, search_query = render_filters()
-        
-        # Apply filters
-        filtered_feedbacks = filter_feedbacks(feedbacks, rating_filter, sentiment_filter, search_query)
-        
-        # Stats bar
-        st.markdown(f"""
-        <div class="stats-bar">
-            <div class="stats-label">DISPLAYING <span class="stats-value">{len(filtered_feedbacks)}</span> OF <span class="stats-value">{len(feedbacks)}</span> RECORDS</div>
-            <div class="stats-label">STATUS: <span class="stats-value">ACTIVE</span></div>
-            <div class="stats-label">UPDATED: <span class="stats-value">{datetime.now().strftime('%H:%M:%S')}</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Render feedback items
-        for idx, feedback in enumerate(filtered_feedbacks[:20]):
-            render_feedback_item(feedback, idx)
+    if feedbacks is not None and not feedbacks.empty:
+        render_feedback_stream(feedbacks)
     else:
         st.markdown('<div class="terminal-box">NO FEEDBACK STREAM DETECTED</div>', unsafe_allow_html=True)
     